@@ -2,9 +2,10 @@
 
 import logging
 import os
-from distutils.command.build_ext import build_ext
 from typing import Any
 
+from setuptools.command.build_ext import build_ext
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,8 +26,21 @@ def build(setup_kwargs: Any) -> None:
     if os.environ.get("SKIP_CYTHON", False):
         return
     try:
+        import Cython
         from Cython.Build import cythonize
 
+        cython_version = tuple(
+            int(part) for part in Cython.__version__.split(".")[:2] if part.isdigit()
+        )
+        if cython_version < (3, 0):
+            raise RuntimeError(
+                f"Cython 3.0+ is required to build habluetooth extensions, "
+                f"found {Cython.__version__}"
+            )
+        print(
+            f"habluetooth: building Cython extensions with Cython "
+            f"{Cython.__version__}"
+        )
         setup_kwargs.update(
             {
                 "ext_modules": cythonize(
@@ -37,7 +51,14 @@ def build(setup_kwargs: Any) -> None:
                         "src/habluetooth/models.py",
                         "src/habluetooth/scanner.py",
                     ],
-                    compiler_directives={"language_level": "3"},  # Python 3
+                    compiler_directives={
+                        "language_level": "3",  # Python 3
+                        "boundscheck": False,
+                        "wraparound": False,
+                        "initializedcheck": False,
+                        "cdivision": True,
+                    },
+                    nthreads=os.cpu_count() or 1,
                 ),
                 "cmdclass": {"build_ext": BuildExt},
             }
@@ -45,7 +66,9 @@ def build(setup_kwargs: Any) -> None:
         setup_kwargs["exclude_package_data"] = {
             pkg: ["*.c"] for pkg in setup_kwargs["packages"]
         }
-    except Exception:
+    except Exception as ex:
         if os.environ.get("REQUIRE_CYTHON"):
             raise
-        pass
+        print(
+            f"habluetooth: falling back to pure Python, extensions not built: {ex}"
+        )
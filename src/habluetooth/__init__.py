@@ -1,10 +1,8 @@
 __version__ = "3.6.0"
 
-from .advertisement_tracker import (
-    TRACKER_BUFFERING_WOBBLE_SECONDS,
-    AdvertisementTracker,
-)
-from .base_scanner import BaseHaRemoteScanner, BaseHaScanner
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .central_manager import get_manager, set_manager
 from .const import (
     CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
@@ -13,17 +11,44 @@ from .const import (
     SCANNER_WATCHDOG_TIMEOUT,
     UNAVAILABLE_TRACK_SECONDS,
 )
-from .manager import BluetoothManager
-from .models import (
-    BluetoothServiceInfo,
-    BluetoothServiceInfoBleak,
-    HaBluetoothConnector,
-)
-from .scanner import BluetoothScanningMode, HaScanner, ScannerStartError
-from .scanner_device import BluetoothScannerDevice
-from .wrappers import HaBleakClientWrapper, HaBleakScannerWrapper
 
-__all__ = [
+if TYPE_CHECKING:
+    from .advertisement_tracker import (
+        TRACKER_BUFFERING_WOBBLE_SECONDS,
+        AdvertisementTracker,
+    )
+    from .base_scanner import BaseHaRemoteScanner, BaseHaScanner
+    from .manager import BluetoothManager
+    from .models import (
+        BluetoothServiceInfo,
+        BluetoothServiceInfoBleak,
+        HaBluetoothConnector,
+    )
+    from .scanner import BluetoothScanningMode, HaScanner, ScannerStartError
+    from .scanner_device import BluetoothScannerDevice
+    from .wrappers import HaBleakClientWrapper, HaBleakScannerWrapper
+
+# Submodules such as manager and wrappers import bleak which is
+# expensive to import, so they are only imported on first access
+# to keep the cost of importing the package itself low.
+_LAZY_IMPORTS = {
+    "AdvertisementTracker": "advertisement_tracker",
+    "TRACKER_BUFFERING_WOBBLE_SECONDS": "advertisement_tracker",
+    "BaseHaRemoteScanner": "base_scanner",
+    "BaseHaScanner": "base_scanner",
+    "BluetoothManager": "manager",
+    "BluetoothServiceInfo": "models",
+    "BluetoothServiceInfoBleak": "models",
+    "HaBluetoothConnector": "models",
+    "BluetoothScanningMode": "scanner",
+    "HaScanner": "scanner",
+    "ScannerStartError": "scanner",
+    "BluetoothScannerDevice": "scanner_device",
+    "HaBleakClientWrapper": "wrappers",
+    "HaBleakScannerWrapper": "wrappers",
+}
+
+__all__ = (
     "CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS",
     "FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS",
     "SCANNER_WATCHDOG_INTERVAL",
@@ -45,4 +70,18 @@ __all__ = [
     "ScannerStartError",
     "get_manager",
     "set_manager",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded attribute on first access."""
+    if (module_name := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes including the lazily loaded ones."""
+    return [*globals(), *_LAZY_IMPORTS]
@@ -2,14 +2,34 @@ import cython
 
 from .models cimport BluetoothServiceInfoBleak
 
+cdef int _ADVERTISING_TIMES_NEEDED
+
 cdef class AdvertisementTracker:
 
     cdef public dict intervals
     cdef public dict fallback_intervals
     cdef public dict sources
     cdef public dict _timings
+    cdef public dict _source_to_addresses
 
-    @cython.locals(timings=list)
+    @cython.locals(
+        address=str,
+        source=str,
+        addresses=set,
+        timings=list,
+        i=cython.Py_ssize_t,
+        current_time=double,
+        previous_time=double,
+        max_time_between_advertisements=double,
+        time_between_advertisements=double,
+    )
     cpdef void async_collect(self, BluetoothServiceInfoBleak service_info)
 
     cpdef void async_remove_address(self, object address)
+
+    cpdef void async_remove_fallback_interval(self, str address)
+
+    cpdef void async_remove_source(self, str source)
+
+    @cython.locals(timings=dict)
+    cpdef void async_scanner_paused(self, str source)
@@ -16,11 +16,21 @@ TRACKER_BUFFERING_WOBBLE_SECONDS = 5
 
 _str = str
 
+# Typed alias so the compiled module compares against a C int while the
+# public constant stays visible as a module attribute in both builds.
+_ADVERTISING_TIMES_NEEDED = ADVERTISING_TIMES_NEEDED
+
 
 class AdvertisementTracker:
     """Tracker to determine the interval that a device is advertising."""
 
-    __slots__ = ("_timings", "fallback_intervals", "intervals", "sources")
+    __slots__ = (
+        "_source_to_addresses",
+        "_timings",
+        "fallback_intervals",
+        "intervals",
+        "sources",
+    )
 
     def __init__(self) -> None:
         """Initialize the tracker."""
@@ -28,6 +38,7 @@ class AdvertisementTracker:
         self.fallback_intervals: dict[str, float] = {}
         self.sources: dict[str, str] = {}
         self._timings: dict[str, list[float]] = {}
+        self._source_to_addresses: dict[str, set[str]] = {}
 
     def async_diagnostics(self) -> dict[str, dict[str, Any]]:
         """Return diagnostics."""
@@ -47,17 +58,31 @@ class AdvertisementTracker:
         the source has changed before calling this function.
         """
         address = service_info.address
-        self.sources[address] = service_info.source
-        timings = self._timings.setdefault(address, [])
+        if (timings := self._timings.get(address)) is None:
+            # First advertisement from this address since the caller
+            # verified the source has not changed, so the source and
+            # reverse index only need to be written once here instead
+            # of on every advertisement.
+            source = service_info.source
+            self.sources[address] = source
+            if (addresses := self._source_to_addresses.get(source)) is None:
+                self._source_to_addresses[source] = {address}
+            else:
+                addresses.add(address)
+            self._timings[address] = [service_info.time]
+            return
         timings.append(service_info.time)
-        if len(timings) != ADVERTISING_TIMES_NEEDED:
+        if len(timings) != _ADVERTISING_TIMES_NEEDED:
             return
 
-        max_time_between_advertisements = timings[1] - timings[0]
+        previous_time = timings[1]
+        max_time_between_advertisements = previous_time - timings[0]
         for i in range(2, len(timings)):
-            time_between_advertisements = timings[i] - timings[i - 1]
+            current_time = timings[i]
+            time_between_advertisements = current_time - previous_time
             if time_between_advertisements > max_time_between_advertisements:
                 max_time_between_advertisements = time_between_advertisements
+            previous_time = current_time
 
         # We now know the maximum time between advertisements
         self.intervals[address] = max_time_between_advertisements
@@ -66,15 +91,33 @@ class AdvertisementTracker:
     def async_remove_address(self, address: _str) -> None:
         """Remove the tracker."""
         self.intervals.pop(address, None)
-        self.sources.pop(address, None)
+        if (source := self.sources.pop(address, None)) is not None and (
+            addresses := self._source_to_addresses.get(source)
+        ) is not None:
+            addresses.discard(address)
+            if not addresses:
+                del self._source_to_addresses[source]
         self._timings.pop(address, None)
 
     def async_remove_fallback_interval(self, address: str) -> None:
         """Remove fallback interval."""
         self.fallback_intervals.pop(address, None)
 
+    def async_scanner_paused(self, source: str) -> None:
+        """
+        Discard in-flight timings for a scanner that paused scanning.
+
+        A paused scanner leaves a gap between advertisements that would
+        be learned as part of the advertising interval, so any partially
+        collected timings from that scanner must be thrown away.
+        """
+        timings = self._timings
+        for address in self._source_to_addresses.get(source, ()):
+            timings.pop(address, None)
+
     def async_remove_source(self, source: str) -> None:
         """Remove the tracker."""
-        for address, tracked_source in list(self.sources.items()):
-            if tracked_source == source:
-                self.async_remove_address(address)
+        for address in self._source_to_addresses.pop(source, ()):
+            self.intervals.pop(address, None)
+            self.sources.pop(address, None)
+            self._timings.pop(address, None)
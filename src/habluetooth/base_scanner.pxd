@@ -28,11 +28,15 @@ cdef class BaseHaScanner:
     cpdef tuple get_discovered_device_advertisement_data(self, str address)
 
 
+cdef class _ConnectingContext:
+
+    cdef BaseHaScanner scanner
+
+
 cdef class BaseHaRemoteScanner(BaseHaScanner):
 
     cdef public dict _details
     cdef public float _expire_seconds
-    cdef public object _cancel_track
     cdef public dict _previous_service_info
 
     @cython.locals(
@@ -45,6 +49,9 @@ cdef class BaseHaRemoteScanner(BaseHaScanner):
         has_service_data=bint,
         has_service_uuids=bint,
         prev_details=dict,
+        device_details=dict,
+        merged_uuids=list,
+        uuid=str,
         service_info=BluetoothServiceInfoBleak,
         prev_service_info=BluetoothServiceInfoBleak
     )
@@ -61,10 +68,16 @@ cdef class BaseHaRemoteScanner(BaseHaScanner):
         double advertisement_monotonic_time
     )
 
-    @cython.locals(now=float, timestamp=float, service_info=BluetoothServiceInfoBleak)
-    cpdef void _async_expire_devices(self)
+    @cython.locals(advertisement=tuple)
+    cpdef void _async_on_advertisements(self, object advertisements)
 
-    cpdef void _schedule_expire_devices(self)
+    @cython.locals(
+        expired_before=double,
+        previous_service_info=dict,
+        service_info=BluetoothServiceInfoBleak,
+        expired=list,
+    )
+    cpdef void _async_expire_devices(self)
 
     @cython.locals(info=BluetoothServiceInfoBleak)
     cpdef tuple get_discovered_device_advertisement_data(self, str address)
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Generator
-from contextlib import contextmanager
+from sys import intern
+from types import TracebackType
 from typing import TYPE_CHECKING, Any, Final, Iterable, final
 
 from bleak.backends.device import BLEDevice
@@ -31,6 +31,39 @@ _int = int
 _str = str
 
 
+class _ConnectingContext:
+    """
+    Track the connecting state of a scanner.
+
+    A hand-rolled context manager is used instead of
+    contextlib.contextmanager to avoid the generator frame
+    allocation on every connection attempt.
+    """
+
+    __slots__ = ("scanner",)
+
+    def __init__(self, scanner: BaseHaScanner) -> None:
+        """Initialize the context."""
+        self.scanner = scanner
+
+    def __enter__(self) -> None:
+        """Increment the connecting count."""
+        scanner = self.scanner
+        scanner._connecting += 1
+        scanner.scanning = not scanner._connecting
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Decrement the connecting count."""
+        scanner = self.scanner
+        scanner._connecting -= 1
+        scanner.scanning = not scanner._connecting
+
+
 class BaseHaScanner:
     """Base class for high availability BLE scanners."""
 
@@ -57,7 +90,7 @@ class BaseHaScanner:
     ) -> None:
         """Initialize the scanner."""
         self.connectable = False
-        self.source = source
+        self.source = intern(source)
         self.connector = connector
         self._connecting = 0
         self.adapter = adapter
@@ -91,8 +124,8 @@ class BaseHaScanner:
         loop = self._loop
         if TYPE_CHECKING:
             assert loop is not None
-        self._cancel_watchdog = loop.call_at(
-            loop.time() + SCANNER_WATCHDOG_INTERVAL_SECONDS,
+        self._cancel_watchdog = loop.call_later(
+            SCANNER_WATCHDOG_INTERVAL_SECONDS,
             self._async_call_scanner_watchdog,
         )
 
@@ -105,11 +138,12 @@ class BaseHaScanner:
     def _async_watchdog_triggered(self) -> bool:
         """Check if the watchdog has been triggered."""
         time_since_last_detection = monotonic_time_coarse() - self._last_detection
-        _LOGGER.debug(
-            "%s: Scanner watchdog time_since_last_detection: %s",
-            self.name,
-            time_since_last_detection,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Scanner watchdog time_since_last_detection: %s",
+                self.name,
+                time_since_last_detection,
+            )
         return time_since_last_detection > SCANNER_WATCHDOG_TIMEOUT
 
     def _async_scanner_watchdog(self) -> None:
@@ -135,16 +169,9 @@ class BaseHaScanner:
     def _unsetup(self) -> None:
         """Unset up the scanner."""
 
-    @contextmanager
-    def connecting(self) -> Generator[None, None, None]:
+    def connecting(self) -> _ConnectingContext:
         """Context manager to track connecting state."""
-        self._connecting += 1
-        self.scanning = not self._connecting
-        try:
-            yield
-        finally:
-            self._connecting -= 1
-            self.scanning = not self._connecting
+        return _ConnectingContext(self)
 
     @property
     def discovered_devices(self) -> list[BLEDevice]:
@@ -197,7 +224,6 @@ class BaseHaRemoteScanner(BaseHaScanner):
     """Base class for a high availability remote BLE scanner."""
 
     __slots__ = (
-        "_cancel_track",
         "_details",
         "_expire_seconds",
         "_previous_service_info",
@@ -217,7 +243,6 @@ class BaseHaRemoteScanner(BaseHaScanner):
         # Scanners only care about connectable devices. The manager
         # will handle taking care of availability for non-connectable devices
         self._expire_seconds = CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS
-        self._cancel_track: asyncio.TimerHandle | None = None
         self._previous_service_info: dict[str, BluetoothServiceInfoBleak] = {}
 
     def restore_discovered_devices(
@@ -252,11 +277,21 @@ class BaseHaRemoteScanner(BaseHaScanner):
         self,
     ) -> DiscoveredDeviceAdvertisementData:
         """Serialize discovered devices to be stored."""
+        discovered_device_advertisement_datas: dict[
+            str, tuple[BLEDevice, AdvertisementData]
+        ] = {}
+        discovered_device_timestamps: dict[str, float] = {}
+        for address, service_info in self._previous_service_info.items():
+            discovered_device_advertisement_datas[address] = (
+                service_info.device,
+                service_info.advertisement,
+            )
+            discovered_device_timestamps[address] = service_info.time
         return DiscoveredDeviceAdvertisementData(
             self.connectable,
             self._expire_seconds,
-            self._discovered_device_advertisement_datas,
-            self._discovered_device_timestamps,
+            discovered_device_advertisement_datas,
+            discovered_device_timestamps,
         )
 
     @property
@@ -280,49 +315,50 @@ class BaseHaRemoteScanner(BaseHaScanner):
             for address, service_info in self._previous_service_info.items()
         }
 
-    def _cancel_expire_devices(self) -> None:
-        """Cancel the expiration of old devices."""
-        if self._cancel_track:
-            self._cancel_track.cancel()
-            self._cancel_track = None
-
     def _unsetup(self) -> None:
         """Unset up the scanner."""
         self._async_stop_scanner_watchdog()
-        self._cancel_expire_devices()
 
     def async_setup(self) -> CALLBACK_TYPE:
         """Set up the scanner."""
         super().async_setup()
-        self._schedule_expire_devices()
         self._async_setup_scanner_watchdog()
         return self._unsetup
 
-    def _schedule_expire_devices(self) -> None:
-        """Schedule the expiration of old devices."""
-        loop = self._loop
-        if TYPE_CHECKING:
-            assert loop is not None
-        self._cancel_expire_devices()
-        self._cancel_track = loop.call_at(
-            loop.time() + 30, self._async_expire_devices_schedule_next
-        )
-
-    def _async_expire_devices_schedule_next(self) -> None:
-        """Expire old devices and schedule the next expiration."""
+    def _async_scanner_watchdog(self) -> None:
+        """Check the scanner and expire stale devices."""
+        # Expiring devices on the watchdog tick avoids a second
+        # TimerHandle per scanner in the event loop heap since both
+        # ran on the same 30 second cadence.
         self._async_expire_devices()
-        self._schedule_expire_devices()
+        super()._async_scanner_watchdog()
 
     def _async_expire_devices(self) -> None:
         """Expire old devices."""
-        now = monotonic_time_coarse()
-        expired = [
-            address
-            for address, service_info in self._previous_service_info.items()
-            if now - service_info.time > self._expire_seconds
-        ]
-        for address in expired:
-            del self._previous_service_info[address]
+        expired_before = monotonic_time_coarse() - self._expire_seconds
+        previous_service_info = self._previous_service_info
+        expired: list[str] | None = None
+        for address, service_info in previous_service_info.items():
+            if service_info.time < expired_before:
+                if expired is None:
+                    expired = [address]
+                else:
+                    expired.append(address)
+        if expired is None:
+            # The common case: nothing expired on this sweep.
+            return
+        if len(expired) * 2 > len(previous_service_info):
+            # When most devices expired at once, rebuilding the dict
+            # compacts it instead of leaving the sparse table that
+            # per-key deletes would leave behind.
+            self._previous_service_info = {
+                address: service_info
+                for address, service_info in previous_service_info.items()
+                if service_info.time >= expired_before
+            }
+        else:
+            for address in expired:
+                del previous_service_info[address]
 
     @property
     def discovered_devices(self) -> list[BLEDevice]:
@@ -368,14 +404,28 @@ class BaseHaRemoteScanner(BaseHaScanner):
         """Call the registered callback."""
         self.scanning = not self._connecting
         self._last_detection = advertisement_monotonic_time
+        # Interning the address makes every dict lookup keyed by it an
+        # identity hit since each advertisement arrives with a freshly
+        # parsed address string.
+        address = intern(address)
         if (prev_service_info := self._previous_service_info.get(address)) is None:
-            # We expect this is the rare case and since py3.11+ has
-            # near zero cost try on success, and we can avoid .get()
-            # which is slower than [] we use the try/except pattern.
+            # First sighting of this address. dict.get keeps the common
+            # already-discovered case to a single probe, while a
+            # try/except would pay to raise and catch KeyError on
+            # every new device.
+            if details:
+                device_details = self._details.copy()
+                device_details.update(details)
+            else:
+                # Most remote scanners pass no per-advertisement
+                # details, so the scanner-level details dict can be
+                # shared; the merge branch below copies on write
+                # before mutating it.
+                device_details = self._details
             device = BLEDevice(
                 address,
                 local_name,
-                {**self._details, **details},
+                device_details,
                 rssi,  # deprecated, will be removed in newer bleak
             )
         else:
@@ -394,7 +444,26 @@ class BaseHaRemoteScanner(BaseHaScanner):
 
             has_service_uuids = bool(service_uuids)
             if has_service_uuids and service_uuids != prev_service_uuids:
-                service_uuids = list({*service_uuids, *prev_service_uuids})
+                merged_uuids = None
+                if len(service_uuids) == len(prev_service_uuids):
+                    for uuid in service_uuids:
+                        if uuid not in prev_service_uuids:
+                            merged_uuids = list(prev_service_uuids)
+                            break
+                else:
+                    merged_uuids = list(prev_service_uuids)
+                if merged_uuids is None:
+                    # Same UUIDs in a different order; reuse the
+                    # previous list instead of allocating a merged one.
+                    service_uuids = prev_service_uuids
+                else:
+                    # The short lists typical of BLE advertisements
+                    # make a linear scan cheaper than building a set
+                    # for the union.
+                    for uuid in service_uuids:
+                        if uuid not in merged_uuids:
+                            merged_uuids.append(uuid)
+                    service_uuids = merged_uuids
             elif not has_service_uuids:
                 service_uuids = prev_service_uuids
 
@@ -419,7 +488,13 @@ class BaseHaRemoteScanner(BaseHaScanner):
             #
             device = prev_device
             device.name = local_name
-            prev_details.update(details)
+            if details:
+                if prev_details is self._details:
+                    # Copy-on-write: the details dict was shared with
+                    # the scanner when this device was first seen.
+                    prev_details = self._details.copy()
+                    device.details = prev_details
+                prev_details.update(details)
             # pylint: disable-next=protected-access
             device._rssi = rssi  # deprecated, will be removed in newer bleak
 
@@ -439,6 +514,54 @@ class BaseHaRemoteScanner(BaseHaScanner):
         self._previous_service_info[address] = service_info
         self._manager.scanner_adv_received(service_info)
 
+    def _async_on_advertisements(
+        self,
+        advertisements: Iterable[
+            tuple[
+                str,
+                int,
+                str | None,
+                list[str],
+                dict[str, bytes],
+                dict[int, bytes],
+                int | None,
+                dict[Any, Any],
+                float,
+            ]
+        ],
+    ) -> None:
+        """
+        Call the registered callback for a batch of advertisements.
+
+        Remote transports that deliver several advertisements per
+        message can hand the whole batch over in one call; each
+        advertisement is processed with exactly the same semantics
+        as _async_on_advertisement.
+        """
+        for advertisement in advertisements:
+            (
+                address,
+                rssi,
+                local_name,
+                service_uuids,
+                service_data,
+                manufacturer_data,
+                tx_power,
+                details,
+                advertisement_monotonic_time,
+            ) = advertisement
+            self._async_on_advertisement(
+                address,
+                rssi,
+                local_name,
+                service_uuids,
+                service_data,
+                manufacturer_data,
+                tx_power,
+                details,
+                advertisement_monotonic_time,
+            )
+
     async def async_diagnostics(self) -> dict[str, Any]:
         """Return diagnostic information about the scanner."""
         now = monotonic_time_coarse()
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .manager import BluetoothManager
 
+_manager: BluetoothManager | None = None
+
 
 class CentralBluetoothManager:
     """Central Bluetooth Manager."""
@@ -16,11 +18,14 @@ class CentralBluetoothManager:
 
 def get_manager() -> BluetoothManager:
     """Get the BluetoothManager."""
-    if CentralBluetoothManager.manager is None:
+    if _manager is None:
         raise RuntimeError("BluetoothManager has not been set")
-    return CentralBluetoothManager.manager
+    return _manager
 
 
 def set_manager(manager: BluetoothManager) -> None:
     """Set the BluetoothManager."""
+    global _manager
+    _manager = manager
+    # Kept in sync for callers that still read the class attribute.
     CentralBluetoothManager.manager = manager
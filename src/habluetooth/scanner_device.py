@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from .base_scanner import BaseHaScanner
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, eq=False)
 class BluetoothScannerDevice:
     """Data for a bluetooth device from a given scanner."""
 
@@ -0,0 +1,102 @@
+"""Tests for the advertisement tracker."""
+
+from __future__ import annotations
+
+from bleak.backends.device import BLEDevice
+
+from habluetooth import BluetoothServiceInfoBleak
+from habluetooth.advertisement_tracker import (
+    ADVERTISING_TIMES_NEEDED,
+    AdvertisementTracker,
+)
+
+from . import generate_advertisement_data
+
+
+def _make_service_info(
+    address: str, source: str, time: float
+) -> BluetoothServiceInfoBleak:
+    """Build a service info for the tracker."""
+    return BluetoothServiceInfoBleak(
+        "test",
+        address,
+        -60,
+        {},
+        {},
+        [],
+        source,
+        BLEDevice(address, "test", {}, -60),
+        generate_advertisement_data(local_name="test"),
+        True,
+        time,
+        None,
+    )
+
+
+def test_async_collect_learns_interval() -> None:
+    """Test the tracker learns the interval once it has enough samples."""
+    tracker = AdvertisementTracker()
+    address = "44:44:33:11:23:45"
+    for i in range(ADVERTISING_TIMES_NEEDED):
+        tracker.async_collect(_make_service_info(address, "esp32_1", float(i)))
+
+    assert tracker.intervals[address] == 1.0
+    assert tracker.sources[address] == "esp32_1"
+    assert address not in tracker._timings
+
+
+def test_async_scanner_paused_discards_partial_timings() -> None:
+    """Test pausing a scanner discards its partially collected timings."""
+    tracker = AdvertisementTracker()
+    address = "44:44:33:11:23:45"
+    other_address = "44:44:33:11:23:46"
+    tracker.async_collect(_make_service_info(address, "esp32_1", 1.0))
+    tracker.async_collect(_make_service_info(address, "esp32_1", 2.0))
+    tracker.async_collect(_make_service_info(other_address, "esp32_2", 1.0))
+    assert address in tracker._timings
+    assert other_address in tracker._timings
+
+    tracker.async_scanner_paused("esp32_1")
+    assert address not in tracker._timings
+    # Other scanners keep their in-flight timings
+    assert other_address in tracker._timings
+    # Pausing an unknown source is a no-op
+    tracker.async_scanner_paused("not_a_source")
+    assert other_address in tracker._timings
+
+    # Collection restarts cleanly after the pause
+    tracker.async_collect(_make_service_info(address, "esp32_1", 10.0))
+    assert tracker._timings[address] == [10.0]
+
+
+def test_async_remove_address_prunes_reverse_index() -> None:
+    """Test removing an address cleans up the source reverse index."""
+    tracker = AdvertisementTracker()
+    address = "44:44:33:11:23:45"
+    other_address = "44:44:33:11:23:46"
+    tracker.async_collect(_make_service_info(address, "esp32_1", 1.0))
+    tracker.async_collect(_make_service_info(other_address, "esp32_1", 1.0))
+    assert tracker._source_to_addresses["esp32_1"] == {address, other_address}
+
+    tracker.async_remove_address(address)
+    assert tracker._source_to_addresses["esp32_1"] == {other_address}
+    tracker.async_remove_address(other_address)
+    # The empty set is pruned so pauses don't walk dead sources
+    assert "esp32_1" not in tracker._source_to_addresses
+    # Pausing after everything was removed is a no-op
+    tracker.async_scanner_paused("esp32_1")
+
+
+def test_async_remove_source_drops_all_addresses() -> None:
+    """Test removing a source drops its addresses from all tracker state."""
+    tracker = AdvertisementTracker()
+    address = "44:44:33:11:23:45"
+    for i in range(ADVERTISING_TIMES_NEEDED):
+        tracker.async_collect(_make_service_info(address, "esp32_1", float(i)))
+    tracker.async_collect(_make_service_info(address, "esp32_1", 100.0))
+
+    tracker.async_remove_source("esp32_1")
+    assert address not in tracker.intervals
+    assert address not in tracker.sources
+    assert address not in tracker._timings
+    assert "esp32_1" not in tracker._source_to_addresses
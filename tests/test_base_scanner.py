@@ -146,6 +146,213 @@ async def test_remote_scanner(name_2: str | None) -> None:
     unsetup()
 
 
+@pytest.mark.usefixtures("enable_bluetooth")
+@pytest.mark.asyncio
+async def test_remote_scanner_service_uuid_merge_paths() -> None:
+    """Test the service_uuids merge branches."""
+    manager = get_manager()
+    connector = HaBluetoothConnector(
+        MockBleakClient, "mock_bleak_client", lambda: False
+    )
+    scanner = FakeScanner("esp32", "esp32", connector, True)
+    unsetup = scanner.async_setup()
+    cancel = manager.async_register_scanner(scanner)
+
+    address = "44:44:33:11:23:45"
+    uuid_1 = "050a021a-0000-1000-8000-00805f9b34fb"
+    uuid_2 = "00000001-0000-1000-8000-00805f9b34fb"
+    uuid_3 = "00000002-0000-1000-8000-00805f9b34fb"
+
+    def inject(service_uuids: list[str]) -> None:
+        scanner._async_on_advertisement(
+            address,
+            -100,
+            "wohand",
+            service_uuids,
+            {},
+            {},
+            None,
+            {},
+            monotonic_time_coarse(),
+        )
+
+    inject([uuid_1, uuid_2])
+    prev_service_uuids = scanner._previous_service_info[address].service_uuids
+    assert prev_service_uuids == [uuid_1, uuid_2]
+
+    # A reordering of the same UUIDs reuses the previous list
+    inject([uuid_2, uuid_1])
+    assert scanner._previous_service_info[address].service_uuids is (
+        prev_service_uuids
+    )
+
+    # Same length but different contents merges in order
+    inject([uuid_1, uuid_3])
+    merged = scanner._previous_service_info[address].service_uuids
+    assert merged == [uuid_1, uuid_2, uuid_3]
+
+    # A shorter list with nothing new keeps the merged set
+    inject([uuid_2])
+    assert scanner._previous_service_info[address].service_uuids == [
+        uuid_1,
+        uuid_2,
+        uuid_3,
+    ]
+
+    # No UUIDs at all keeps the previous list by identity
+    prev_service_uuids = scanner._previous_service_info[address].service_uuids
+    inject([])
+    assert scanner._previous_service_info[address].service_uuids is (
+        prev_service_uuids
+    )
+
+    cancel()
+    unsetup()
+
+
+@pytest.mark.usefixtures("enable_bluetooth")
+@pytest.mark.asyncio
+async def test_remote_scanner_shared_details_copy_on_write() -> None:
+    """Test detail-less devices share the scanner details until a merge."""
+    manager = get_manager()
+    connector = HaBluetoothConnector(
+        MockBleakClient, "mock_bleak_client", lambda: False
+    )
+    scanner = FakeScanner("esp32", "esp32", connector, True)
+    unsetup = scanner.async_setup()
+    cancel = manager.async_register_scanner(scanner)
+
+    now = monotonic_time_coarse()
+    scanner._async_on_advertisement(
+        "44:44:33:11:23:45", -100, "wohand", [], {}, {}, None, {}, now
+    )
+    scanner._async_on_advertisement(
+        "44:44:33:11:23:46", -100, "other", [], {}, {}, None, {}, now
+    )
+
+    data = scanner.discovered_devices_and_advertisement_data
+    device, _ = data["44:44:33:11:23:45"]
+    other_device, _ = data["44:44:33:11:23:46"]
+    # With no per-advertisement details both devices share the
+    # scanner-level details dict
+    assert device.details is scanner._details
+    assert other_device.details is scanner._details
+
+    # Merging real details copies on write instead of polluting
+    # the shared dict
+    scanner._async_on_advertisement(
+        "44:44:33:11:23:45",
+        -100,
+        "wohand",
+        [],
+        {},
+        {},
+        None,
+        {"scanner_specific_data": "test"},
+        now,
+    )
+    data = scanner.discovered_devices_and_advertisement_data
+    device, _ = data["44:44:33:11:23:45"]
+    assert device.details is not scanner._details
+    assert device.details == {"source": "esp32", "scanner_specific_data": "test"}
+    assert scanner._details == {"source": "esp32"}
+    assert other_device.details is scanner._details
+
+    # Further merges mutate the device's own copy in place
+    copied_details = device.details
+    scanner._async_on_advertisement(
+        "44:44:33:11:23:45",
+        -100,
+        "wohand",
+        [],
+        {},
+        {},
+        None,
+        {"scanner_specific_data": "test2"},
+        now,
+    )
+    data = scanner.discovered_devices_and_advertisement_data
+    device, _ = data["44:44:33:11:23:45"]
+    assert device.details is copied_details
+    assert device.details["scanner_specific_data"] == "test2"
+
+    cancel()
+    unsetup()
+
+
+@pytest.mark.usefixtures("enable_bluetooth")
+@pytest.mark.asyncio
+async def test_remote_scanner_batch() -> None:
+    """Test the remote scanner processes a batch of advertisements."""
+    manager = get_manager()
+
+    switchbot_device = generate_ble_device(
+        "44:44:33:11:23:45",
+        "wohand",
+        {},
+        rssi=-100,
+    )
+    switchbot_device_adv = generate_advertisement_data(
+        local_name="wohand",
+        service_uuids=["050a021a-0000-1000-8000-00805f9b34fb"],
+        service_data={"050a021a-0000-1000-8000-00805f9b34fb": b"\n\xff"},
+        manufacturer_data={1: b"\x01"},
+        rssi=-100,
+    )
+    empty_device = generate_ble_device(
+        "11:22:33:44:55:66",
+        "empty",
+        {},
+        rssi=-100,
+    )
+    empty_device_adv = generate_advertisement_data(
+        local_name="empty",
+        service_uuids=[],
+        service_data={},
+        manufacturer_data={},
+        rssi=-100,
+    )
+
+    connector = HaBluetoothConnector(
+        MockBleakClient, "mock_bleak_client", lambda: False
+    )
+    scanner = FakeScanner("esp32", "esp32", connector, True)
+    unsetup = scanner.async_setup()
+    cancel = manager.async_register_scanner(scanner)
+
+    now = monotonic_time_coarse()
+    scanner._async_on_advertisements(
+        [
+            (
+                device.address,
+                adv.rssi,
+                device.name,
+                adv.service_uuids,
+                adv.service_data,
+                adv.manufacturer_data,
+                adv.tx_power,
+                {"scanner_specific_data": "test"},
+                now,
+            )
+            for device, adv in (
+                (switchbot_device, switchbot_device_adv),
+                (empty_device, empty_device_adv),
+            )
+        ]
+    )
+
+    data = scanner.discovered_devices_and_advertisement_data
+    assert set(data) == {switchbot_device.address, empty_device.address}
+    discovered_device, discovered_adv_data = data[switchbot_device.address]
+    assert discovered_device.name == switchbot_device.name
+    assert (
+        discovered_adv_data.manufacturer_data == switchbot_device_adv.manufacturer_data
+    )
+
+    cancel()
+    unsetup()
+
+
 @pytest.mark.usefixtures("enable_bluetooth")
 @pytest.mark.asyncio
 async def test_remote_scanner_expires_connectable() -> None: